@@ -5,45 +5,314 @@ A comprehensive Model Context Protocol server for Zoho CRM integration.
 
 import os
 import json
+import time
+import queue
+import random
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import requests
+import httpx
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List, Union
 from mcp.server.fastmcp import FastMCP
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
-import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from functools import wraps
+import asyncio
 
 from zoho_auth import ZohoAuth
 
+# Optional fast JSON codec: orjson parses the large record payloads returned
+# by get_records/search_records noticeably faster than the stdlib json module
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+# Optional incremental JSON parser used by the streaming export helper
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Response envelope returned by make_api_request. msgspec structs are
+# fixed-slot objects that are considerably cheaper to allocate than dicts;
+# the __slots__ fallback keeps the same attribute API when msgspec is not
+# installed. Tools convert back to a plain dict at the MCP boundary via
+# to_dict(), which drops unset fields to match the old envelope shapes.
+try:
+    import msgspec
+
+    class ApiResult(msgspec.Struct):
+        status: str
+        status_code: Optional[int] = None
+        data: Optional[Dict[str, Any]] = None
+        message: Optional[str] = None
+        error: Any = None
+
+        def to_dict(self) -> Dict[str, Any]:
+            return {field: value for field in self.__struct_fields__
+                    if (value := getattr(self, field)) is not None}
+except ImportError:
+    msgspec = None
+
+    class ApiResult:
+        __slots__ = ('status', 'status_code', 'data', 'message', 'error')
+
+        def __init__(self, status: str, status_code: Optional[int] = None,
+                     data: Optional[Dict[str, Any]] = None,
+                     message: Optional[str] = None, error: Any = None):
+            self.status = status
+            self.status_code = status_code
+            self.data = data
+            self.message = message
+            self.error = error
+
+        def to_dict(self) -> Dict[str, Any]:
+            return {field: value for field in self.__slots__
+                    if (value := getattr(self, field)) is not None}
+
 # Load environment variables
 load_dotenv()
 
+# Resolved once at import: these settings never change after startup, so
+# re-reading the environment on every API call is wasted work
+_API_VERSION = os.getenv('ZOHO_API_VERSION', 'v2')
+_REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
+
 # Configure logging
 log_file_path = os.getenv('LOG_FILE_PATH', 'logs/zoho_crm_mcp.log')
 log_dir = os.path.dirname(log_file_path)
 if log_dir and not os.path.exists(log_dir):
     os.makedirs(log_dir, exist_ok=True)
 
+# Log records are handed off to a background listener thread so console and
+# file I/O never block the thread serving a tool call
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler(log_file_path)
+_file_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, _stream_handler, _file_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO')),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler(log_file_path)
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
+# Initialize MCP server. The lifespan runs on the server's own event loop,
+# which is where the warm-up probe must happen so the pooled connection it
+# opens belongs to the same loop the tool handlers run on.
+@asynccontextmanager
+async def _server_lifespan(_server):
+    """Kick off the connection warm-up when the server starts serving."""
+    warmup = asyncio.create_task(_warm_up_connection())
+    try:
+        yield {}
+    finally:
+        warmup.cancel()
+
 mcp = FastMCP(
-    name=os.getenv('MCP_SERVER_NAME', 'ZohoCRM')
+    name=os.getenv('MCP_SERVER_NAME', 'ZohoCRM'),
+    lifespan=_server_lifespan
+)
+
+# Shared HTTP session so urllib3's connection pool keeps the TLS connection
+# to Zoho warm between tool calls instead of handshaking on every request.
+# Transient Zoho errors (rate limits and gateway hiccups) are retried with
+# exponential backoff instead of surfacing immediately to the MCP client.
+# POST is deliberately absent: a gateway error does not prove the backend
+# dropped the write, and replaying an insert can create duplicate records.
+_retry_policy = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+    respect_retry_after_header=True
+)
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry_policy))
+
+# Async client used by the tool handlers: HTTP/2 multiplexes concurrent tool
+# calls over a single connection, so MCP clients can issue several reads in
+# parallel without head-of-line blocking. The sync session above stays around
+# for non-async helper paths.
+_aclient = httpx.AsyncClient(
+    http2=True,
+    timeout=_REQUEST_TIMEOUT,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
 )
 
+@atexit.register
+def _close_async_client() -> None:
+    """Close the shared async client on interpreter shutdown."""
+    try:
+        asyncio.run(_aclient.aclose())
+    except Exception:
+        pass
+
 # Global auth instance
 auth: Optional[ZohoAuth] = None
 
+# Flips to True after the first successful auth check so the per-call cost
+# collapses to a single boolean test
+_auth_ready = False
+
+def _ensure_auth() -> None:
+    """Initialize authentication on first use; a cheap flag check afterwards."""
+    global _auth_ready
+    if not _auth_ready:
+        if auth is None:
+            init_auth()
+        _auth_ready = True
+
+# Base URL for CRM endpoints. The saved api_domain can change after startup
+# (the first interactive auth on a non-US data center records e.g.
+# zohoapis.eu), so callers go through _current_base_url(), which compares
+# the auth domain on each request — an attribute read and a string compare —
+# and rebuilds the prefix only when it actually changed.
+_base_url: str = ''
+_base_url_domain: str = ''
+
+def _rebuild_base_url() -> None:
+    """Recompute the CRM endpoint prefix from the current auth domain."""
+    global _base_url, _base_url_domain
+    _base_url_domain = auth.get_api_domain()
+    _base_url = f"{_base_url_domain}/crm/{_API_VERSION}/"
+
+def _current_base_url() -> str:
+    """Return the endpoint prefix, rebuilding it if the API domain changed."""
+    if auth.get_api_domain() != _base_url_domain:
+        _rebuild_base_url()
+    return _base_url
+
+def _get_cached_headers() -> Dict[str, str]:
+    """Get authorization headers for the current token.
+
+    ZohoAuth already caches the dict per token generation, so this is a flag
+    check plus a cached-dict return on the hot path. Going through
+    get_headers() on every call also lets its proactive background refresh
+    fire during the pre-expiry window; a second cache layer here was hiding
+    that trigger until after the token had already gone stale.
+    """
+    return auth.get_headers()
+
+# HTTP methods accepted by make_api_request
+_ALLOWED_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE', 'PATCH'})
+
+# Key whitelists shared by the metadata tools so each call reuses one tuple
+# instead of rebuilding its projection inline
+_MODULE_KEYS = ('api_name', 'singular_label', 'plural_label', 'module_name',
+                'creatable', 'editable', 'deletable', 'viewable')
+_FIELD_KEYS = ('api_name', 'field_label', 'data_type', 'required',
+               'read_only', 'visible', 'length')
+_USER_KEYS = ('id', 'full_name', 'email', 'status', 'created_time', 'modified_time')
+
+def _project(items: List[Dict[str, Any]], keys: tuple) -> List[Dict[str, Any]]:
+    """Project each record down to the whitelisted keys."""
+    return [{key: item.get(key) for key in keys} for item in items]
+
+def _page_params(page: int, per_page: int, **extra: Any) -> Dict[str, Any]:
+    """Build the pagination params shared by the list tools."""
+    params = {'page': page, 'per_page': per_page if per_page < 200 else 200}
+    params.update(extra)
+    return params
+
+def _page_info(info: Dict[str, Any], page: int, per_page: int, count: int) -> Dict[str, Any]:
+    """Build the page_info block from Zoho's info envelope."""
+    return {
+        'page': info.get('page', page),
+        'per_page': info.get('per_page', per_page),
+        'count': info.get('count', count),
+        'more_records': info.get('more_records', False)
+    }
+
+# Read-through cache for the metadata tools: modules, fields, org and user
+# data change rarely, so repeated calls within a session skip the HTTP
+# round-trip entirely. Record tools are never cached.
+_META_CACHE_TTL = 300
+_META_CACHE_MAXSIZE = 128
+_meta_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+def _meta_cached(func):
+    """Cache successful results of a metadata tool for a short TTL (LRU-bounded)."""
+    @wraps(func)
+    async def wrapper(ctx, *args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+
+        entry = _meta_cache.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                _meta_cache.move_to_end(key)
+                return value
+            del _meta_cache[key]
+
+        value = await func(ctx, *args, **kwargs)
+        if isinstance(value, dict) and value.get('status') == 'success':
+            _meta_cache[key] = (time.monotonic() + _META_CACHE_TTL, value)
+            while len(_meta_cache) > _META_CACHE_MAXSIZE:
+                _meta_cache.popitem(last=False)
+        return value
+
+    return wrapper
+
+# Backoff schedule for transient Zoho errors on the async path (the urllib3
+# Retry policy on the sync session does not apply to httpx). Gateway errors
+# are only replayed for idempotent methods — a 502/504 does not prove the
+# backend dropped a write, and replaying an insert can create duplicates.
+# 429 is retried for every method since a rate-limited request was rejected
+# before processing.
+_RETRY_STATUSES = (429, 502, 503, 504)
+_IDEMPOTENT_METHODS = frozenset({'GET', 'PUT', 'DELETE'})
+_MAX_RETRIES = 3
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+async def _request_with_backoff(method: str, url: str, headers: Dict[str, str],
+                                params: Optional[Dict], body: Optional[bytes],
+                                timeout: int) -> httpx.Response:
+    """Issue a request, retrying 429 (and 5xx for idempotent methods) with
+    exponential backoff and jitter."""
+    for attempt in range(_MAX_RETRIES + 1):
+        response = await _aclient.request(method, url, headers=headers, params=params, content=body, timeout=timeout)
+
+        retryable = (response.status_code == 429
+                     or method in _IDEMPOTENT_METHODS)
+        if response.status_code not in _RETRY_STATUSES or not retryable or attempt == _MAX_RETRIES:
+            return response
+
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            delay = min(_BACKOFF_CAP, float(retry_after))
+        else:
+            delay = min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt) * (1 + random.uniform(0, 0.5))
+        await asyncio.sleep(delay)
+
+    return response
+
 def init_auth():
     """Initialize Zoho authentication."""
     global auth
@@ -63,85 +332,80 @@ def init_auth():
         api_domain=os.getenv('ZOHO_API_DOMAIN', 'https://www.zohoapis.com'),
         accounts_domain=os.getenv('ZOHO_ACCOUNTS_DOMAIN', 'https://accounts.zoho.com')
     )
+    _rebuild_base_url()
 
-def require_auth(func):
-    """Decorator to ensure authentication before API calls."""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        if not auth:
-            init_auth()
-        
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            logger.error(f"Error in {func.__name__}: {e}")
-            raise
-    
-    return wrapper
+def _wrap_response(response: httpx.Response) -> ApiResult:
+    """Build the standard success/error envelope from an HTTP response."""
+    if response.status_code in (200, 201, 202):
+        return ApiResult(
+            status='success',
+            status_code=response.status_code,
+            data=_json_loads(response.content)
+        )
 
-def make_api_request(endpoint: str, method: str = 'GET', data: Optional[Dict] = None, params: Optional[Dict] = None) -> Dict[str, Any]:
+    # Decode the body once and attempt a single JSON parse, rather than
+    # materializing response.text and then re-parsing it via response.json()
+    body = response.content
+    text = body.decode('utf-8', 'replace')
+    try:
+        error = _json_loads(body)
+    except Exception:
+        error = text
+
+    return ApiResult(
+        status='error',
+        status_code=response.status_code,
+        message=text,
+        error=error
+    )
+
+async def make_api_request(endpoint: str, method: str = 'GET', data: Optional[Dict] = None, params: Optional[Dict] = None) -> ApiResult:
     """Make authenticated API request to Zoho CRM."""
-    if not auth:
-        raise Exception("Authentication not initialized")
-    
-    headers = auth.get_headers()
-    api_domain = auth.get_api_domain()
-    api_version = os.getenv('ZOHO_API_VERSION', 'v2')
-    
-    url = f"{api_domain}/crm/{api_version}/{endpoint}"
-    
-    timeout = int(os.getenv('REQUEST_TIMEOUT', '30'))
-    
+    _ensure_auth()
+
+    method = method.upper()
+    if method not in _ALLOWED_METHODS:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    # Header retrieval can block (a stale token triggers a synchronous
+    # refresh, or even the interactive OAuth flow), so it runs in a worker
+    # thread to keep the event loop free for concurrent tool calls
+    headers = await asyncio.to_thread(_get_cached_headers)
+    url = _current_base_url() + endpoint
+
+    # Serialize the body once ourselves instead of letting requests run
+    # json.dumps internally (headers already carry Content-Type: application/json)
+    body = _json_dumps(data) if data is not None else None
+
     try:
-        if method == 'GET':
-            response = requests.get(url, headers=headers, params=params, timeout=timeout)
-        elif method == 'POST':
-            response = requests.post(url, headers=headers, json=data, params=params, timeout=timeout)
-        elif method == 'PUT':
-            response = requests.put(url, headers=headers, json=data, params=params, timeout=timeout)
-        elif method == 'DELETE':
-            response = requests.delete(url, headers=headers, params=params, timeout=timeout)
-        else:
-            raise ValueError(f"Unsupported HTTP method: {method}")
-        
-        if response.status_code in [200, 201, 202]:
-            return {
-                'status': 'success',
-                'status_code': response.status_code,
-                'data': response.json()
-            }
-        else:
-            return {
-                'status': 'error',
-                'status_code': response.status_code,
-                'message': response.text,
-                'error': response.json() if response.headers.get('content-type', '').startswith('application/json') else response.text
-            }
-    
-    except requests.exceptions.Timeout:
-        return {
-            'status': 'error',
-            'message': 'Request timed out',
-            'error': 'timeout'
-        }
-    except requests.exceptions.RequestException as e:
-        return {
-            'status': 'error',
-            'message': f'Request failed: {str(e)}',
-            'error': str(e)
-        }
+        for attempt in range(2):
+            response = await _request_with_backoff(method, url, headers, params, body, _REQUEST_TIMEOUT)
+
+            # A 401 means the token was rejected server-side even though the
+            # local clock still considers it valid; mark it stale so the
+            # re-fetch goes through the refresh flow, then retry once
+            if response.status_code == 401 and attempt == 0:
+                auth.invalidate_access_token()
+                headers = await asyncio.to_thread(_get_cached_headers)
+                continue
+            break
+
+        return _wrap_response(response)
+
+    except httpx.TimeoutException:
+        logger.error("Request to %s timed out", endpoint)
+        return ApiResult(status='error', message='Request timed out', error='timeout')
+    except httpx.HTTPError as e:
+        logger.error("Request to %s failed: %s", endpoint, e)
+        return ApiResult(status='error', message=f'Request failed: {str(e)}', error=str(e))
     except Exception as e:
-        return {
-            'status': 'error',
-            'message': f'Unexpected error: {str(e)}',
-            'error': str(e)
-        }
+        logger.error("Unexpected error calling %s: %s", endpoint, e)
+        return ApiResult(status='error', message=f'Unexpected error: {str(e)}', error=str(e))
 
 # Authentication Tools
 
 @mcp.tool()
-@require_auth
-def authenticate_zoho(ctx) -> Dict[str, Any]:
+async def authenticate_zoho(ctx) -> Dict[str, Any]:
     """
     Authenticate with Zoho CRM. This will open a browser window for OAuth if needed.
     
@@ -149,7 +413,10 @@ def authenticate_zoho(ctx) -> Dict[str, Any]:
         Dict containing authentication status and user information
     """
     try:
-        token = auth.get_valid_access_token()
+        _ensure_auth()
+        # May refresh or run the full interactive OAuth flow (browser plus a
+        # five-minute callback wait), so it must not run on the event loop
+        token = await asyncio.to_thread(auth.get_valid_access_token)
         if not token:
             return {
                 'status': 'error',
@@ -157,10 +424,10 @@ def authenticate_zoho(ctx) -> Dict[str, Any]:
             }
         
         # Test the token by making a simple API call
-        result = make_api_request('users?type=CurrentUser')
+        result = await make_api_request('users?type=CurrentUser')
         
-        if result['status'] == 'success':
-            user_data = result['data'].get('users', [{}])[0]
+        if result.status == 'success':
+            user_data = result.data.get('users', [{}])[0]
             return {
                 'status': 'success',
                 'message': 'Successfully authenticated with Zoho CRM',
@@ -172,18 +439,17 @@ def authenticate_zoho(ctx) -> Dict[str, Any]:
                 }
             }
         else:
-            return result
+            return result.to_dict()
             
     except Exception as e:
-        logger.error(f"Authentication error: {e}")
+        logger.error("Authentication error: %s", e)
         return {
             'status': 'error',
             'message': f'Authentication error: {str(e)}'
         }
 
 @mcp.tool()
-@require_auth
-def revoke_authentication(ctx) -> Dict[str, Any]:
+async def revoke_authentication(ctx) -> Dict[str, Any]:
     """
     Revoke Zoho CRM authentication and clear stored tokens.
     
@@ -191,7 +457,9 @@ def revoke_authentication(ctx) -> Dict[str, Any]:
         Dict containing revocation status
     """
     try:
-        success = auth.revoke_tokens()
+        _ensure_auth()
+        # Blocking POST to the accounts host; run off the event loop
+        success = await asyncio.to_thread(auth.revoke_tokens)
         if success:
             return {
                 'status': 'success',
@@ -203,7 +471,7 @@ def revoke_authentication(ctx) -> Dict[str, Any]:
                 'message': 'Failed to revoke authentication'
             }
     except Exception as e:
-        logger.error(f"Token revocation error: {e}")
+        logger.error("Token revocation error: %s", e)
         return {
             'status': 'error',
             'message': f'Error revoking authentication: {str(e)}'
@@ -212,41 +480,29 @@ def revoke_authentication(ctx) -> Dict[str, Any]:
 # Module and Metadata Tools
 
 @mcp.tool()
-@require_auth
-def get_modules(ctx) -> Dict[str, Any]:
+@_meta_cached
+async def get_modules(ctx) -> Dict[str, Any]:
     """
     Get all available modules in Zoho CRM.
     
     Returns:
         Dict containing list of available modules and their metadata
     """
-    result = make_api_request('settings/modules')
+    result = await make_api_request('settings/modules')
     
-    if result['status'] == 'success':
-        modules = result['data'].get('modules', [])
+    if result.status == 'success':
+        modules = result.data.get('modules', [])
         return {
             'status': 'success',
             'count': len(modules),
-            'modules': [
-                {
-                    'api_name': module.get('api_name'),
-                    'singular_label': module.get('singular_label'),
-                    'plural_label': module.get('plural_label'),
-                    'module_name': module.get('module_name'),
-                    'creatable': module.get('creatable'),
-                    'editable': module.get('editable'),
-                    'deletable': module.get('deletable'),
-                    'viewable': module.get('viewable')
-                }
-                for module in modules
-            ]
+            'modules': _project(modules, _MODULE_KEYS)
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def get_module_fields(ctx, module_name: str) -> Dict[str, Any]:
+@_meta_cached
+async def get_module_fields(ctx, module_name: str) -> Dict[str, Any]:
     """
     Get field information for a specific module.
     
@@ -256,36 +512,27 @@ def get_module_fields(ctx, module_name: str) -> Dict[str, Any]:
     Returns:
         Dict containing field information for the module
     """
-    result = make_api_request(f'settings/fields?module={module_name}')
+    result = await make_api_request(f'settings/fields?module={module_name}')
     
-    if result['status'] == 'success':
-        fields = result['data'].get('fields', [])
+    if result.status == 'success':
+        fields = result.data.get('fields', [])
+        projected = _project(fields, _FIELD_KEYS)
+        for field, slim in zip(fields, projected):
+            slim['pick_list_values'] = field.get('pick_list_values', []) if field.get('data_type') == 'picklist' else None
+
         return {
             'status': 'success',
             'module': module_name,
             'count': len(fields),
-            'fields': [
-                {
-                    'api_name': field.get('api_name'),
-                    'field_label': field.get('field_label'),
-                    'data_type': field.get('data_type'),
-                    'required': field.get('required'),
-                    'read_only': field.get('read_only'),
-                    'visible': field.get('visible'),
-                    'length': field.get('length'),
-                    'pick_list_values': field.get('pick_list_values', []) if field.get('data_type') == 'picklist' else None
-                }
-                for field in fields
-            ]
+            'fields': projected
         }
     
-    return result
+    return result.to_dict()
 
 # Record Management Tools
 
 @mcp.tool()
-@require_auth
-def get_records(ctx, module_name: str, page: int = 1, per_page: int = 200, sort_order: str = 'desc', sort_by: str = 'Modified_Time') -> Dict[str, Any]:
+async def get_records(ctx, module_name: str, page: int = 1, per_page: int = 200, sort_order: str = 'desc', sort_by: str = 'Modified_Time') -> Dict[str, Any]:
     """
     Get records from a specific module.
     
@@ -299,38 +546,82 @@ def get_records(ctx, module_name: str, page: int = 1, per_page: int = 200, sort_
     Returns:
         Dict containing records from the module
     """
-    params = {
-        'page': page,
-        'per_page': min(per_page, 200),
-        'sort_order': sort_order,
-        'sort_by': sort_by
-    }
-    
-    result = make_api_request(module_name, params=params)
-    
-    if result['status'] == 'success':
-        data = result['data']
+    params = _page_params(page, per_page, sort_order=sort_order, sort_by=sort_by)
+
+    result = await make_api_request(module_name, params=params)
+
+    if result.status == 'success':
+        data = result.data
         records = data.get('data', [])
         info = data.get('info', {})
-        
+
         return {
             'status': 'success',
             'module': module_name,
             'count': len(records),
-            'page_info': {
-                'page': info.get('page', page),
-                'per_page': info.get('per_page', per_page),
-                'count': info.get('count', len(records)),
-                'more_records': info.get('more_records', False)
-            },
+            'page_info': _page_info(info, page, per_page, len(records)),
             'records': records
         }
     
-    return result
+    return result.to_dict()
+
+def iter_records(module_name: str, per_page: int = 200, sort_order: str = 'desc', sort_by: str = 'Modified_Time'):
+    """
+    Yield records from a module one at a time without buffering whole pages.
+
+    Streams each page's HTTP response through ijson so multi-megabyte bodies
+    are parsed as they arrive, keeping peak memory at roughly one record.
+    Falls back to a full-page parse when ijson is not installed. Intended for
+    exporter-style consumers walking an entire module; the get_records tool
+    remains the right choice for small fetches.
+
+    Args:
+        module_name: Name of the module (e.g., 'Leads', 'Contacts', 'Deals')
+        per_page: Records per page (default: 200, max: 200)
+        sort_order: Sort order 'asc' or 'desc' (default: 'desc')
+        sort_by: Field to sort by (default: 'Modified_Time')
+
+    Yields:
+        Record dicts as returned by Zoho
+    """
+    _ensure_auth()
+
+    per_page = min(per_page, 200)
+    page = 1
+
+    while True:
+        params = {
+            'page': page,
+            'per_page': per_page,
+            'sort_order': sort_order,
+            'sort_by': sort_by
+        }
+
+        with _session.get(_current_base_url() + module_name, headers=_get_cached_headers(), params=params,
+                          stream=True, timeout=_REQUEST_TIMEOUT) as response:
+            # Zoho returns 204 for a page past the end of the module
+            if response.status_code == 204:
+                return
+            response.raise_for_status()
+
+            count = 0
+            if ijson is not None:
+                response.raw.decode_content = True
+                for record in ijson.items(response.raw, 'data.item'):
+                    count += 1
+                    yield record
+            else:
+                for record in _json_loads(response.content).get('data', []):
+                    count += 1
+                    yield record
+
+        # A short page means there is nothing left to fetch
+        if count < per_page:
+            return
+        page += 1
 
 @mcp.tool()
-@require_auth
-def get_record_by_id(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
+async def get_record_by_id(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
     """
     Get a specific record by its ID.
     
@@ -341,10 +632,10 @@ def get_record_by_id(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
     Returns:
         Dict containing the record data
     """
-    result = make_api_request(f'{module_name}/{record_id}')
+    result = await make_api_request(f'{module_name}/{record_id}')
     
-    if result['status'] == 'success':
-        records = result['data'].get('data', [])
+    if result.status == 'success':
+        records = result.data.get('data', [])
         return {
             'status': 'success',
             'module': module_name,
@@ -352,11 +643,10 @@ def get_record_by_id(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
             'record': records[0] if records else None
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def search_records(ctx, module_name: str, criteria: str, page: int = 1, per_page: int = 200) -> Dict[str, Any]:
+async def search_records(ctx, module_name: str, criteria: str, page: int = 1, per_page: int = 200) -> Dict[str, Any]:
     """
     Search for records in a specific module using criteria.
     
@@ -369,38 +659,28 @@ def search_records(ctx, module_name: str, criteria: str, page: int = 1, per_page
     Returns:
         Dict containing matching records
     """
-    params = {
-        'criteria': criteria,
-        'page': page,
-        'per_page': min(per_page, 200)
-    }
-    
-    result = make_api_request(f'{module_name}/search', params=params)
-    
-    if result['status'] == 'success':
-        data = result['data']
+    params = _page_params(page, per_page, criteria=criteria)
+
+    result = await make_api_request(f'{module_name}/search', params=params)
+
+    if result.status == 'success':
+        data = result.data
         records = data.get('data', [])
         info = data.get('info', {})
-        
+
         return {
             'status': 'success',
             'module': module_name,
             'criteria': criteria,
             'count': len(records),
-            'page_info': {
-                'page': info.get('page', page),
-                'per_page': info.get('per_page', per_page),
-                'count': info.get('count', len(records)),
-                'more_records': info.get('more_records', False)
-            },
+            'page_info': _page_info(info, page, per_page, len(records)),
             'records': records
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def create_record(ctx, module_name: str, record_data: Dict[str, Any], trigger_workflow: bool = True) -> Dict[str, Any]:
+async def create_record(ctx, module_name: str, record_data: Dict[str, Any], trigger_workflow: bool = True) -> Dict[str, Any]:
     """
     Create a new record in a specific module.
     
@@ -418,10 +698,10 @@ def create_record(ctx, module_name: str, record_data: Dict[str, Any], trigger_wo
     if not trigger_workflow:
         params['trigger'] = 'workflow'
     
-    result = make_api_request(module_name, method='POST', data=data, params=params)
+    result = await make_api_request(module_name, method='POST', data=data, params=params)
     
-    if result['status'] == 'success':
-        created_records = result['data'].get('data', [])
+    if result.status == 'success':
+        created_records = result.data.get('data', [])
         return {
             'status': 'success',
             'module': module_name,
@@ -429,11 +709,10 @@ def create_record(ctx, module_name: str, record_data: Dict[str, Any], trigger_wo
             'created_record': created_records[0] if created_records else None
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def update_record(ctx, module_name: str, record_id: str, record_data: Dict[str, Any], trigger_workflow: bool = True) -> Dict[str, Any]:
+async def update_record(ctx, module_name: str, record_id: str, record_data: Dict[str, Any], trigger_workflow: bool = True) -> Dict[str, Any]:
     """
     Update an existing record in a specific module.
     
@@ -446,19 +725,18 @@ def update_record(ctx, module_name: str, record_id: str, record_data: Dict[str,
     Returns:
         Dict containing the update result
     """
-    # Add the record ID to the data
-    record_data['id'] = record_id
-    
-    data = {'data': [record_data]}
+    # Include the record ID without mutating the caller's dict, so immutable
+    # record templates can be reused across update calls
+    data = {'data': [{**record_data, 'id': record_id}]}
     params = {}
     
     if not trigger_workflow:
         params['trigger'] = 'workflow'
     
-    result = make_api_request(f'{module_name}/{record_id}', method='PUT', data=data, params=params)
+    result = await make_api_request(f'{module_name}/{record_id}', method='PUT', data=data, params=params)
     
-    if result['status'] == 'success':
-        updated_records = result['data'].get('data', [])
+    if result.status == 'success':
+        updated_records = result.data.get('data', [])
         return {
             'status': 'success',
             'module': module_name,
@@ -467,11 +745,10 @@ def update_record(ctx, module_name: str, record_id: str, record_data: Dict[str,
             'updated_record': updated_records[0] if updated_records else None
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def delete_record(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
+async def delete_record(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
     """
     Delete a record from a specific module.
     
@@ -482,10 +759,10 @@ def delete_record(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
     Returns:
         Dict containing the deletion result
     """
-    result = make_api_request(f'{module_name}/{record_id}', method='DELETE')
+    result = await make_api_request(f'{module_name}/{record_id}', method='DELETE')
     
-    if result['status'] == 'success':
-        deleted_records = result['data'].get('data', [])
+    if result.status == 'success':
+        deleted_records = result.data.get('data', [])
         return {
             'status': 'success',
             'module': module_name,
@@ -494,52 +771,106 @@ def delete_record(ctx, module_name: str, record_id: str) -> Dict[str, Any]:
             'deleted_record': deleted_records[0] if deleted_records else None
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def bulk_create_records(ctx, module_name: str, records_data: List[Dict[str, Any]], trigger_workflow: bool = True) -> Dict[str, Any]:
+async def bulk_create_records(ctx, module_name: str, records_data: List[Dict[str, Any]], trigger_workflow: bool = True) -> Dict[str, Any]:
     """
     Create multiple records in a specific module (bulk operation).
     
     Args:
         module_name: Name of the module (e.g., 'Leads', 'Contacts', 'Deals')
-        records_data: List of dictionaries containing record data (max 100 records)
+        records_data: List of dictionaries containing record data (split into batches of 100 automatically)
         trigger_workflow: Whether to trigger workflows (default: True)
-    
+
     Returns:
         Dict containing the bulk creation results
     """
-    if len(records_data) > 100:
-        return {
-            'status': 'error',
-            'message': 'Maximum 100 records allowed per bulk operation'
-        }
-    
-    data = {'data': records_data}
     params = {}
-    
+
     if not trigger_workflow:
         params['trigger'] = 'workflow'
-    
-    result = make_api_request(module_name, method='POST', data=data, params=params)
-    
-    if result['status'] == 'success':
-        created_records = result['data'].get('data', [])
-        return {
-            'status': 'success',
-            'module': module_name,
-            'message': f'{len(created_records)} records created successfully',
-            'created_records': created_records
-        }
-    
-    return result
+
+    # Zoho caps insert payloads at 100 records; split larger batches into
+    # chunks and send them concurrently, bounded to stay under Zoho's
+    # concurrency limits
+    chunks = [records_data[i:i + 100] for i in range(0, len(records_data), 100)]
+    semaphore = asyncio.Semaphore(5)
+
+    async def _post_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Any]:
+        async with semaphore:
+            return await make_api_request(module_name, method='POST', data={'data': chunk}, params=params)
+
+    results = await asyncio.gather(*(_post_chunk(chunk) for chunk in chunks))
+
+    created_records = []
+    errors = []
+    for result in results:
+        if result.status == 'success':
+            created_records.extend(result.data.get('data', []))
+        else:
+            errors.append(result.to_dict())
+
+    if errors and not created_records:
+        return errors[0]
+
+    response = {
+        'status': 'success' if not errors else 'partial',
+        'module': module_name,
+        'message': f'{len(created_records)} records created successfully',
+        'created_records': created_records
+    }
+    if errors:
+        response['errors'] = errors
+
+    return response
+
+@mcp.tool()
+async def batch_requests(ctx, requests_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Execute multiple CRM requests concurrently in a single tool call.
+
+    Sessions that would otherwise interleave several read tools (e.g. a
+    record fetch plus its related lists) pay one round-trip wave instead of
+    one round-trip per call.
+
+    Args:
+        requests_list: List of request specs, each a dict with keys:
+                       - endpoint: API endpoint (e.g., 'Leads', 'settings/modules')
+                       - method: HTTP method (optional, default 'GET')
+                       - data: Request body (optional)
+                       - params: Query parameters (optional)
+
+    Returns:
+        Dict containing one result per request, in input order
+    """
+    semaphore = asyncio.Semaphore(5)
+
+    async def _run(spec: Dict[str, Any]) -> Dict[str, Any]:
+        async with semaphore:
+            result = await make_api_request(
+                spec['endpoint'],
+                method=spec.get('method', 'GET'),
+                data=spec.get('data'),
+                params=spec.get('params')
+            )
+        return result.to_dict()
+
+    results = await asyncio.gather(*(_run(spec) for spec in requests_list), return_exceptions=True)
+
+    return {
+        'status': 'success',
+        'count': len(results),
+        'results': [
+            {'status': 'error', 'message': str(item), 'error': str(item)} if isinstance(item, Exception) else item
+            for item in results
+        ]
+    }
 
 # Relationship and Association Tools
 
 @mcp.tool()
-@require_auth
-def get_related_records(ctx, module_name: str, record_id: str, related_module: str, page: int = 1, per_page: int = 200) -> Dict[str, Any]:
+async def get_related_records(ctx, module_name: str, record_id: str, related_module: str, page: int = 1, per_page: int = 200) -> Dict[str, Any]:
     """
     Get related records for a specific record.
     
@@ -553,50 +884,42 @@ def get_related_records(ctx, module_name: str, record_id: str, related_module: s
     Returns:
         Dict containing related records
     """
-    params = {
-        'page': page,
-        'per_page': min(per_page, 200)
-    }
-    
-    result = make_api_request(f'{module_name}/{record_id}/{related_module}', params=params)
-    
-    if result['status'] == 'success':
-        data = result['data']
+    params = _page_params(page, per_page)
+
+    result = await make_api_request(f'{module_name}/{record_id}/{related_module}', params=params)
+
+    if result.status == 'success':
+        data = result.data
         records = data.get('data', [])
         info = data.get('info', {})
-        
+
         return {
             'status': 'success',
             'module': module_name,
             'record_id': record_id,
             'related_module': related_module,
             'count': len(records),
-            'page_info': {
-                'page': info.get('page', page),
-                'per_page': info.get('per_page', per_page),
-                'count': info.get('count', len(records)),
-                'more_records': info.get('more_records', False)
-            },
+            'page_info': _page_info(info, page, per_page, len(records)),
             'related_records': records
         }
     
-    return result
+    return result.to_dict()
 
 # Dashboard and Analytics Tools
 
 @mcp.tool()
-@require_auth
-def get_organization_info(ctx) -> Dict[str, Any]:
+@_meta_cached
+async def get_organization_info(ctx) -> Dict[str, Any]:
     """
     Get information about the Zoho CRM organization.
     
     Returns:
         Dict containing organization information
     """
-    result = make_api_request('org')
+    result = await make_api_request('org')
     
-    if result['status'] == 'success':
-        org_data = result['data'].get('org', [{}])[0]
+    if result.status == 'success':
+        org_data = result.data.get('org', [{}])[0]
         return {
             'status': 'success',
             'organization': {
@@ -613,11 +936,11 @@ def get_organization_info(ctx) -> Dict[str, Any]:
             }
         }
     
-    return result
+    return result.to_dict()
 
 @mcp.tool()
-@require_auth
-def get_users(ctx, type_filter: str = 'AllUsers') -> Dict[str, Any]:
+@_meta_cached
+async def get_users(ctx, type_filter: str = 'AllUsers') -> Dict[str, Any]:
     """
     Get information about CRM users.
     
@@ -628,36 +951,28 @@ def get_users(ctx, type_filter: str = 'AllUsers') -> Dict[str, Any]:
         Dict containing user information
     """
     params = {'type': type_filter}
-    result = make_api_request('users', params=params)
-    
-    if result['status'] == 'success':
-        users = result['data'].get('users', [])
+    result = await make_api_request('users', params=params)
+    
+    if result.status == 'success':
+        users = result.data.get('users', [])
+        projected = _project(users, _USER_KEYS)
+        for user, slim in zip(users, projected):
+            slim['role'] = user.get('role', {}).get('name')
+            slim['profile'] = user.get('profile', {}).get('name')
+
         return {
             'status': 'success',
             'type_filter': type_filter,
             'count': len(users),
-            'users': [
-                {
-                    'id': user.get('id'),
-                    'full_name': user.get('full_name'),
-                    'email': user.get('email'),
-                    'role': user.get('role', {}).get('name'),
-                    'profile': user.get('profile', {}).get('name'),
-                    'status': user.get('status'),
-                    'created_time': user.get('created_time'),
-                    'modified_time': user.get('modified_time')
-                }
-                for user in users
-            ]
+            'users': projected
         }
     
-    return result
+    return result.to_dict()
 
 # Utility Tools
 
 @mcp.tool()
-@require_auth
-def convert_lead(ctx, lead_id: str, convert_data: Dict[str, Any]) -> Dict[str, Any]:
+async def convert_lead(ctx, lead_id: str, convert_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Convert a lead to Account, Contact, and optionally Deal.
     
@@ -676,10 +991,10 @@ def convert_lead(ctx, lead_id: str, convert_data: Dict[str, Any]) -> Dict[str, A
     """
     data = {'data': [convert_data]}
     
-    result = make_api_request(f'Leads/{lead_id}/actions/convert', method='POST', data=data)
+    result = await make_api_request(f'Leads/{lead_id}/actions/convert', method='POST', data=data)
     
-    if result['status'] == 'success':
-        conversion_data = result['data'].get('data', [{}])[0]
+    if result.status == 'success':
+        conversion_data = result.data.get('data', [{}])[0]
         return {
             'status': 'success',
             'lead_id': lead_id,
@@ -687,11 +1002,10 @@ def convert_lead(ctx, lead_id: str, convert_data: Dict[str, Any]) -> Dict[str, A
             'conversion_result': conversion_data
         }
     
-    return result
+    return result.to_dict()
 
-@mcp.tool() 
-@require_auth
-def get_record_count(ctx, module_name: str, criteria: str = None) -> Dict[str, Any]:
+@mcp.tool()
+async def get_record_count(ctx, module_name: str, criteria: str = None) -> Dict[str, Any]:
     """
     Get the count of records in a module, optionally with search criteria.
     
@@ -708,10 +1022,10 @@ def get_record_count(ctx, module_name: str, criteria: str = None) -> Dict[str, A
     if criteria:
         params['criteria'] = criteria
     
-    result = make_api_request(endpoint, params=params)
+    result = await make_api_request(endpoint, params=params)
     
-    if result['status'] == 'success':
-        count_data = result['data']
+    if result.status == 'success':
+        count_data = result.data
         return {
             'status': 'success',
             'module': module_name,
@@ -719,14 +1033,35 @@ def get_record_count(ctx, module_name: str, criteria: str = None) -> Dict[str, A
             'count': count_data.get('count', 0)
         }
     
-    return result
+    return result.to_dict()
+
+# Fires once when the server starts serving (via the lifespan above) so the
+# first tool call finds a warm keep-alive connection in the async client's
+# pool instead of paying DNS resolution plus a full TLS handshake
+_warmup_started = False
+
+async def _warm_up_connection() -> None:
+    """Probe the CRM API once to pre-open a pooled async connection."""
+    global _warmup_started
+    # Only warm up when a valid token already exists: get_headers() on an
+    # expired or absent token would launch the interactive OAuth flow, and
+    # startup must never open a browser as a side effect
+    if _warmup_started or auth is None or not auth.is_token_valid():
+        return
+    _warmup_started = True
+    try:
+        headers = await asyncio.to_thread(_get_cached_headers)
+        await _aclient.get(_current_base_url() + 'users', params={'type': 'CurrentUser'},
+                           headers=headers, timeout=5)
+    except Exception:
+        pass
 
 # Initialize authentication on import
 try:
     init_auth()
     logger.info("Zoho CRM MCP Server initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize auth: {e}")
+    logger.error("Failed to initialize auth: %s", e)
     logger.info("Authentication will be initialized on first tool call")
 
 if __name__ == "__main__":
@@ -7,62 +7,117 @@ import os
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from typing import Optional, Dict, Any
-from urllib.parse import urlencode
-import webbrowser
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
-from threading import Thread
-import queue
+from urllib.parse import urlencode, parse_qs, urlparse
+from threading import Thread, Lock, Event
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# webbrowser and http.server are imported lazily inside the interactive
+# authorization path: it runs at most once per process (and never when valid
+# tokens exist on disk), so cold starts shouldn't pay for their import trees
+
+# Optional fast JSON codec for token (de)serialization; this path runs on
+# every cold start and refresh, so orjson is used when available
+try:
+    import orjson
+
+    def _json_loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _json_loads(raw: bytes) -> Any:
+        return json.loads(raw)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
 
 logger = logging.getLogger(__name__)
 
-class CallbackServer(BaseHTTPRequestHandler):
-    """Simple HTTP server to handle OAuth callback."""
-    
-    def do_GET(self):
-        """Handle GET request for OAuth callback."""
-        if self.path.startswith('/callback'):
-            query_params = parse_qs(urlparse(self.path).query)
-            if 'code' in query_params:
-                self.server.auth_code = query_params['code'][0]
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(b"""
-                <html>
-                <body>
-                    <h2>Authorization Successful!</h2>
-                    <p>You can now close this window and return to your application.</p>
-                    <script>window.close();</script>
-                </body>
-                </html>
-                """)
-            elif 'error' in query_params:
-                self.server.auth_error = query_params['error'][0]
-                self.send_response(400)
-                self.send_header('Content-type', 'text/html')
+# Seconds before the server-reported expiry at which a token is treated as
+# stale. The background refresh kicks in one minute ahead of this window so
+# it normally completes before the foreground path ever sees a stale token.
+REFRESH_SKEW_SECONDS = 300
+
+# Prebuilt callback pages: sent with Content-Length in a single write so the
+# browser renders (and window.close() fires) as soon as possible
+_SUCCESS_HTML = (
+    b"<html>\n"
+    b"<body>\n"
+    b"    <h2>Authorization Successful!</h2>\n"
+    b"    <p>You can now close this window and return to your application.</p>\n"
+    b"    <script>window.close();</script>\n"
+    b"</body>\n"
+    b"</html>\n"
+)
+_ERROR_HTML_TEMPLATE = (
+    b"<html>\n"
+    b"<body>\n"
+    b"    <h2>Authorization Failed!</h2>\n"
+    b"    <p>Error: %b</p>\n"
+    b"</body>\n"
+    b"</html>\n"
+)
+
+def _create_callback_server(address):
+    """Build the one-shot OAuth callback server.
+
+    Defined in a factory so http.server is only imported when the
+    interactive flow actually runs.
+    """
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    class CallbackHandler(BaseHTTPRequestHandler):
+        """Simple HTTP handler for the OAuth callback."""
+
+        def do_GET(self):
+            """Handle GET request for OAuth callback."""
+            if self.path.startswith('/callback'):
+                query_params = parse_qs(urlparse(self.path).query)
+                if 'code' in query_params:
+                    self.server.auth_code = query_params['code'][0]
+                    self.server.callback_received.set()
+                    self._send_page(200, _SUCCESS_HTML)
+                elif 'error' in query_params:
+                    self.server.auth_error = query_params['error'][0]
+                    self.server.callback_received.set()
+                    body = _ERROR_HTML_TEMPLATE % query_params.get('error_description', ['Unknown error'])[0].encode()
+                    self._send_page(400, body)
+            else:
+                self.send_response(404)
                 self.end_headers()
-                self.wfile.write(b"""
-                <html>
-                <body>
-                    <h2>Authorization Failed!</h2>
-                    <p>Error: """ + query_params.get('error_description', ['Unknown error'])[0].encode() + b"""</p>
-                </body>
-                </html>
-                """)
-        else:
-            self.send_response(404)
+
+        def _send_page(self, status: int, body: bytes) -> None:
+            """Send an HTML page with Content-Length in a single body write."""
+            self.send_response(status)
+            self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(body)))
             self.end_headers()
-    
-    def log_message(self, format, *args):
-        """Suppress default HTTP server logging."""
-        pass
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Suppress default HTTP server logging."""
+            pass
+
+    server = ThreadingHTTPServer(address, CallbackHandler)
+    server.auth_code = None
+    server.auth_error = None
+    server.callback_received = Event()
+    return server
 
 class ZohoAuth:
     """Handles Zoho OAuth authentication and token management."""
-    
+
+    # Keys that identify a token payload; expires_at is deliberately excluded
+    # so a refresh returning the same tokens doesn't force a rewrite
+    _TOKEN_IDENTITY_KEYS = ('access_token', 'refresh_token', 'api_domain', 'token_type', 'scope')
+
     def __init__(self, 
                  client_id: str,
                  client_secret: str,
@@ -77,34 +132,110 @@ class ZohoAuth:
         self.redirect_uri = redirect_uri
         self.scope = scope
         self.token_file_path = token_file_path
+        # Ensure the token directory exists once at construction instead of
+        # re-checking it on every save (the default path has no directory)
+        token_dir = os.path.dirname(token_file_path)
+        if token_dir:
+            os.makedirs(token_dir, exist_ok=True)
         self.api_domain = api_domain
         self.accounts_domain = accounts_domain
         self.access_token = None
         self.refresh_token = None
         self.token_expires_at = None
         self.api_domain_for_tokens = None
-        
+
+        # Derived values recomputed whenever tokens change, so the per-call
+        # validity check and header construction stay cheap
+        self._expiry_deadline = 0.0
+        self._auth_header: Optional[str] = None
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._last_saved_tokens: Optional[Dict[str, Any]] = None
+
+        # Shared HTTP session: keep-alive reuses one TCP+TLS connection per
+        # host instead of handshaking on every token and API call
+        self._session = requests.Session()
+        # The accounts host gets a retry policy so transient 5xx responses on
+        # token refresh heal at the transport layer; POST is included because
+        # refresh is idempotent for the same refresh token
+        accounts_retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(["POST", "GET"]),
+            raise_on_status=False,
+        )
+        self._session.mount(
+            self.accounts_domain,
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False,
+                        max_retries=accounts_retry),
+        )
+        self._session.mount(
+            self.api_domain,
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False),
+        )
+        self._session.headers.update({
+            'User-Agent': 'zoho-crm-mcp/1.0',
+            'Connection': 'keep-alive'
+        })
+
+        # Single-flight refresh machinery: concurrent callers share one
+        # in-flight refresh instead of each hitting the token endpoint
+        self._refresh_lock = Lock()
+        self._refresh_future: Optional[Future] = None
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='zoho-refresh')
+
+        # The authorization URL only depends on constructor arguments, so
+        # encode it once instead of on every get_authorization_url call
+        self._auth_url = f"{self.accounts_domain}/oauth/v2/auth?" + urlencode({
+            'scope': self.scope,
+            'client_id': self.client_id,
+            'response_type': 'code',
+            'redirect_uri': self.redirect_uri,
+            'access_type': 'offline',
+            'prompt': 'consent'
+        })
+
         # Load existing tokens
         self._load_tokens()
+
+        # Warm the accounts host in the background so the first token refresh
+        # finds an established connection (DNS + TLS already paid for)
+        self._refresh_executor.submit(self._warm_accounts_connection)
+
+    def _warm_accounts_connection(self) -> None:
+        """Pre-open a keep-alive connection to the accounts host; best effort."""
+        try:
+            self._session.head(self.accounts_domain, timeout=2, allow_redirects=False)
+        except Exception:
+            pass
     
     def _load_tokens(self) -> None:
         """Load tokens from file if they exist."""
-        if os.path.exists(self.token_file_path):
-            try:
-                with open(self.token_file_path, 'r') as f:
-                    tokens = json.load(f)
-                    self.access_token = tokens.get('access_token')
-                    self.refresh_token = tokens.get('refresh_token')
-                    self.token_expires_at = tokens.get('expires_at')
-                    self.api_domain_for_tokens = tokens.get('api_domain', self.api_domain)
-                    logger.info("Loaded existing tokens from file")
-            except Exception as e:
-                logger.error(f"Failed to load tokens: {e}")
+        # Open directly rather than exists()+open: one stat syscall instead
+        # of two, and no race against a concurrent writer in between. Reading
+        # bytes lets the JSON parser skip the text-decoding layer.
+        try:
+            with open(self.token_file_path, 'rb') as f:
+                tokens = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.error(f"Failed to load tokens: {e}")
+            return
+
+        self.access_token = tokens.get('access_token')
+        self.refresh_token = tokens.get('refresh_token')
+        self.token_expires_at = tokens.get('expires_at')
+        self.api_domain_for_tokens = tokens.get('api_domain', self.api_domain)
+        self._last_saved_tokens = tokens
+        self._recompute_derived()
+        logger.info("Loaded existing tokens from file")
     
     def _save_tokens(self, tokens: Dict[str, Any]) -> None:
         """Save tokens to file."""
         try:
-            # Calculate expiration time
+            # Calculate expiration time; this is deliberately wall-clock,
+            # since the absolute epoch stamp must survive process restarts
             expires_at = time.time() + tokens.get('expires_in', 3600)
             
             token_data = {
@@ -116,40 +247,54 @@ class ZohoAuth:
                 'scope': tokens.get('scope', self.scope)
             }
             
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.token_file_path) if os.path.dirname(self.token_file_path) else '.', exist_ok=True)
-            
-            with open(self.token_file_path, 'w') as f:
-                json.dump(token_data, f, indent=2)
-            
-            # Update instance variables
-            self.access_token = token_data['access_token']
-            self.refresh_token = token_data['refresh_token']
-            self.token_expires_at = token_data['expires_at']
-            self.api_domain_for_tokens = token_data['api_domain']
+            # Serialize writers so concurrent refreshes can't tear the file
+            with self._refresh_lock:
+                # Skip the disk write entirely when a refresh handed back the
+                # same tokens; only the in-memory expiry needs updating
+                unchanged = self._last_saved_tokens is not None and all(
+                    token_data.get(key) == self._last_saved_tokens.get(key)
+                    for key in self._TOKEN_IDENTITY_KEYS
+                )
+
+                if not unchanged:
+                    # Write compactly to a temp file and rename into place so
+                    # a crash mid-write can never corrupt the stored tokens
+                    tmp_path = self.token_file_path + '.tmp'
+                    payload = _json_dumps(token_data)
+                    with open(tmp_path, 'wb', buffering=64 * 1024) as f:
+                        f.write(payload)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(tmp_path, self.token_file_path)
+                    self._last_saved_tokens = token_data
+
+                # Update instance variables
+                self.access_token = token_data['access_token']
+                self.refresh_token = token_data['refresh_token']
+                self.token_expires_at = token_data['expires_at']
+                self.api_domain_for_tokens = token_data['api_domain']
+                self._recompute_derived()
             
             logger.info("Tokens saved successfully")
         except Exception as e:
             logger.error(f"Failed to save tokens: {e}")
             raise
     
+    def _recompute_derived(self) -> None:
+        """Refresh the precomputed expiry deadline and Authorization value."""
+        self._expiry_deadline = (self.token_expires_at or 0) - REFRESH_SKEW_SECONDS
+        self._auth_header = f'Zoho-oauthtoken {self.access_token}' if self.access_token else None
+        self._cached_headers = None
+
     def get_authorization_url(self) -> str:
-        """Generate the authorization URL for OAuth flow."""
-        params = {
-            'scope': self.scope,
-            'client_id': self.client_id,
-            'response_type': 'code',
-            'redirect_uri': self.redirect_uri,
-            'access_type': 'offline',
-            'prompt': 'consent'
-        }
-        
-        auth_url = f"{self.accounts_domain}/oauth/v2/auth?{urlencode(params)}"
-        return auth_url
+        """Return the authorization URL for the OAuth flow."""
+        return self._auth_url
     
     def authorize_interactive(self) -> bool:
         """Perform interactive OAuth authorization."""
         try:
+            import webbrowser
+
             auth_url = self.get_authorization_url()
             
             print(f"\\n{'='*60}")
@@ -160,24 +305,31 @@ class ZohoAuth:
             print(f"{auth_url}")
             print(f"{'='*60}\\n")
             
-            # Start callback server
-            server = HTTPServer(('localhost', 8080), CallbackServer)
-            server.auth_code = None
-            server.auth_error = None
-            server.timeout = 300  # 5 minutes timeout
-            
+            # Threading server so favicon/asset requests never block the
+            # OAuth redirect itself
+            server = _create_callback_server(('localhost', 8080))
+
+            # Serve in a background thread and block on an event the handler
+            # sets when the OAuth redirect lands. The main thread sleeps
+            # instead of spinning on handle_request, and stray requests
+            # (favicon fetches and the like) can't confuse the wait.
+            server_thread = Thread(target=server.serve_forever, daemon=True)
+            server_thread.start()
+
             # Open browser
             webbrowser.open(auth_url)
-            
+
             print("Waiting for authorization (timeout: 5 minutes)...")
-            
-            # Handle one request (the callback)
-            start_time = time.time()
-            while time.time() - start_time < 300:
-                server.handle_request()
-                if server.auth_code or server.auth_error:
-                    break
-            
+
+            try:
+                # Event.wait times out on the monotonic clock, so a system
+                # clock adjustment cannot stretch or cut short the deadline
+                server.callback_received.wait(300)
+            finally:
+                server.shutdown()
+                server_thread.join(5)
+                server.server_close()
+
             if server.auth_error:
                 logger.error(f"Authorization failed: {server.auth_error}")
                 return False
@@ -206,15 +358,16 @@ class ZohoAuth:
                 'code': auth_code
             }
             
-            response = requests.post(token_url, data=data)
+            response = self._session.post(token_url, data=data)
             
             if response.status_code == 200:
-                tokens = response.json()
+                tokens = _json_loads(response.content)
                 self._save_tokens(tokens)
                 logger.info("Successfully obtained access tokens")
                 return True
             else:
-                logger.error(f"Token exchange failed: {response.status_code} - {response.text}")
+                logger.error("Token exchange failed: %s - %s",
+                             response.status_code, response.text[:512])
                 return False
                 
         except Exception as e:
@@ -237,15 +390,16 @@ class ZohoAuth:
                 'client_secret': self.client_secret
             }
             
-            response = requests.post(token_url, data=data)
+            response = self._session.post(token_url, data=data)
             
             if response.status_code == 200:
-                tokens = response.json()
+                tokens = _json_loads(response.content)
                 self._save_tokens(tokens)
                 logger.info("Successfully refreshed access token")
                 return True
             else:
-                logger.error(f"Token refresh failed: {response.status_code} - {response.text}")
+                logger.error("Token refresh failed: %s - %s",
+                             response.status_code, response.text[:512])
                 return False
                 
         except Exception as e:
@@ -254,22 +408,70 @@ class ZohoAuth:
     
     def is_token_valid(self) -> bool:
         """Check if the current access token is valid."""
-        if not self.access_token or not self.token_expires_at:
-            return False
-        
-        # Token is valid if it doesn't expire within the next 5 minutes
-        return time.time() < (self.token_expires_at - 300)
-    
+        # The deadline already folds in the REFRESH_SKEW_SECONDS buffer
+        return self.access_token is not None and time.time() < self._expiry_deadline
+
+    def invalidate_access_token(self) -> None:
+        """Mark the current access token stale so the next call refreshes it.
+
+        Used when the server rejects the token (401) before its local expiry,
+        e.g. after a server-side revocation the wall clock knows nothing about.
+        """
+        self._expiry_deadline = 0.0
+        self._cached_headers = None
+
+
+    def _refresh_single_flight(self) -> bool:
+        """Share one in-flight refresh among all concurrent callers."""
+        with self._refresh_lock:
+            # Double-checked: another caller may have refreshed while we
+            # waited on the lock
+            if self.is_token_valid():
+                return True
+
+            future = self._refresh_future
+            if future is None:
+                future = self._refresh_executor.submit(self._run_refresh)
+                self._refresh_future = future
+
+        # Wait outside the lock so the worker can save tokens
+        return future.result()
+
+    def _run_refresh(self) -> bool:
+        """Executor target for a single refresh; clears the shared future."""
+        try:
+            return self.refresh_access_token()
+        finally:
+            with self._refresh_lock:
+                self._refresh_future = None
+
+    def _maybe_kick_background_refresh(self) -> None:
+        """Start a refresh in the background shortly before the token expires.
+
+        Keeps the cached token warm so the first post-expiry request doesn't
+        pay a synchronous round-trip to the token endpoint. Shares the
+        single-flight future, so a foreground refresh never duplicates it.
+        """
+        if not self.refresh_token or not self.token_expires_at:
+            return
+        if self.token_expires_at - time.time() >= REFRESH_SKEW_SECONDS + 60:
+            return
+
+        with self._refresh_lock:
+            if self._refresh_future is None:
+                self._refresh_future = self._refresh_executor.submit(self._run_refresh)
+
     def get_valid_access_token(self) -> Optional[str]:
         """Get a valid access token, refreshing if necessary."""
+        # Fast path: no locking while the cached token is still valid
         if self.is_token_valid():
             return self.access_token
-        
+
         logger.info("Access token expired or invalid, attempting refresh...")
-        
-        if self.refresh_access_token():
+
+        if self._refresh_single_flight():
             return self.access_token
-        
+
         logger.warning("Token refresh failed, interactive authorization required")
         if self.authorize_interactive():
             return self.access_token
@@ -277,20 +479,32 @@ class ZohoAuth:
         logger.error("Failed to obtain valid access token")
         return None
     
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session for callers making their own Zoho requests."""
+        return self._session
+
     def get_api_domain(self) -> str:
         """Get the appropriate API domain for making requests."""
         return self.api_domain_for_tokens or self.api_domain
     
     def get_headers(self) -> Dict[str, str]:
-        """Get the authorization headers for API requests."""
+        """Get the authorization headers for API requests.
+
+        The returned dict is cached per token generation and shared between
+        callers, so it must be treated as read-only.
+        """
+        self._maybe_kick_background_refresh()
         token = self.get_valid_access_token()
         if not token:
             raise Exception("No valid access token available")
-        
-        return {
-            'Authorization': f'Zoho-oauthtoken {token}',
-            'Content-Type': 'application/json'
-        }
+
+        if self._cached_headers is None:
+            self._cached_headers = {
+                'Authorization': self._auth_header,
+                'Content-Type': 'application/json'
+            }
+        return self._cached_headers
     
     def revoke_tokens(self) -> bool:
         """Revoke the current tokens."""
@@ -298,16 +512,18 @@ class ZohoAuth:
             if self.refresh_token:
                 revoke_url = f"{self.accounts_domain}/oauth/v2/token/revoke"
                 data = {'token': self.refresh_token}
-                response = requests.post(revoke_url, data=data)
+                response = self._session.post(revoke_url, data=data)
                 
                 if response.status_code != 200:
-                    logger.warning(f"Token revocation warning: {response.status_code} - {response.text}")
+                    logger.warning("Token revocation warning: %s - %s",
+                                   response.status_code, response.text[:512])
             
             # Clear tokens
             self.access_token = None
             self.refresh_token = None
             self.token_expires_at = None
             self.api_domain_for_tokens = None
+            self._recompute_derived()
             
             # Remove token file
             if os.path.exists(self.token_file_path):
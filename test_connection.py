@@ -7,152 +7,191 @@ This script tests the Zoho CRM authentication and API connectivity independently
 import sys
 import os
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
 from dotenv import load_dotenv
 from zoho_auth import ZohoAuth
-import requests
 import json
 
 def main():
     """Test Zoho CRM connection."""
-    print("="*60)
-    print("    Zoho CRM Connection Test")
-    print("="*60)
-    
+    # Output is buffered per phase and written in one syscall at each
+    # checkpoint, instead of one write per print() line
+    buffer = []
+
+    def echo(line=""):
+        buffer.append(line)
+
+    def flush_output():
+        if buffer:
+            sys.stdout.write("\n".join(buffer) + "\n")
+            sys.stdout.flush()
+            buffer.clear()
+
+    echo("="*60)
+    echo("    Zoho CRM Connection Test")
+    echo("="*60)
+
     # Load environment variables
     load_dotenv()
-    
+
+    # Read every setting from the environment once up front; the scope list
+    # is deduplicated and sorted so equivalent configurations compare equal
+    scope = os.getenv('ZOHO_SCOPE', 'ZohoCRM.modules.ALL,ZohoCRM.settings.ALL,ZohoCRM.users.ALL')
+    config = {
+        'client_id': os.getenv('ZOHO_CLIENT_ID'),
+        'client_secret': os.getenv('ZOHO_CLIENT_SECRET'),
+        'redirect_uri': os.getenv('ZOHO_REDIRECT_URI', 'http://localhost:8080/callback'),
+        'scope': ','.join(sorted(set(scope.split(',')))),
+        'token_file_path': os.getenv('TOKEN_FILE_PATH', '.zoho_tokens.json'),
+    }
+
     # Check for required environment variables
-    client_id = os.getenv('ZOHO_CLIENT_ID')
-    client_secret = os.getenv('ZOHO_CLIENT_SECRET')
-    
+    client_id = config['client_id']
+    client_secret = config['client_secret']
+
     if not client_id or not client_secret:
-        print("❌ Error: ZOHO_CLIENT_ID and ZOHO_CLIENT_SECRET must be set in .env file")
-        print("Please copy .env.example to .env and configure your credentials.")
+        echo("❌ Error: ZOHO_CLIENT_ID and ZOHO_CLIENT_SECRET must be set in .env file")
+        echo("Please copy .env.example to .env and configure your credentials.")
+        flush_output()
         return False
-    
+
     if client_id == "your_client_id_here" or client_secret == "your_client_secret_here":
-        print("❌ Error: Please replace placeholder values in .env with your actual credentials")
+        echo("❌ Error: Please replace placeholder values in .env with your actual credentials")
+        flush_output()
         return False
-    
-    print(f"✓ Found Client ID: {client_id[:10]}...")
-    print(f"✓ Found Client Secret: {client_secret[:10]}...")
-    print()
-    
+
+    echo(f"✓ Found Client ID: {client_id[:10]}...")
+    echo(f"✓ Found Client Secret: {client_secret[:10]}...")
+    echo()
+
     try:
         # Initialize auth handler
-        print("📡 Initializing Zoho authentication...")
-        auth = ZohoAuth(
-            client_id=client_id,
-            client_secret=client_secret,
-            redirect_uri=os.getenv('ZOHO_REDIRECT_URI', 'http://localhost:8080/callback'),
-            scope=os.getenv('ZOHO_SCOPE', 'ZohoCRM.modules.ALL,ZohoCRM.settings.ALL,ZohoCRM.users.ALL'),
-            token_file_path=os.getenv('TOKEN_FILE_PATH', '.zoho_tokens.json')
-        )
-        
+        echo("📡 Initializing Zoho authentication...")
+        flush_output()
+        auth = ZohoAuth(**config)
+
         # Check if we have valid tokens
-        print("🔑 Checking for existing valid tokens...")
+        echo("🔑 Checking for existing valid tokens...")
+        flush_output()
         token = auth.get_valid_access_token()
-        
+
         if not token:
-            print("❌ No valid access token available")
+            echo("❌ No valid access token available")
+            flush_output()
             return False
-        
-        print("✓ Valid access token obtained!")
-        print()
-        
+
+        echo("✓ Valid access token obtained!")
+        echo()
+
         # Test API connectivity
-        print("🧪 Testing Zoho CRM API connectivity...")
-        
-        # Test 1: Get current user info
+        echo("🧪 Testing Zoho CRM API connectivity...")
+        flush_output()
+
         headers = auth.get_headers()
         api_domain = auth.get_api_domain()
-        
-        print("   Testing user information endpoint...")
-        user_url = f"{api_domain}/crm/v2/users?type=CurrentUser"
-        
-        response = requests.get(user_url, headers=headers, timeout=30)
-        
+        session = auth.session
+
+        # The three probes have no data dependency, so fire them concurrently
+        # over the pooled session and render the results in fixed order below
+        probes = [
+            ('users', f"{api_domain}/crm/v2/users?type=CurrentUser"),
+            ('modules', f"{api_domain}/crm/v2/settings/modules"),
+            ('org', f"{api_domain}/crm/v2/org"),
+        ]
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {name: executor.submit(session.get, url, headers=headers, timeout=30)
+                       for name, url in probes}
+            responses = {name: future.result() for name, future in futures.items()}
+
+        # Test 1: Get current user info
+        echo("   Testing user information endpoint...")
+
+        response = responses['users']
+
         if response.status_code == 200:
             user_data = response.json()
             if 'users' in user_data and user_data['users']:
                 user = user_data['users'][0]
-                print(f"   ✓ Connected as: {user.get('full_name', 'Unknown')}")
-                print(f"   ✓ Email: {user.get('email', 'Unknown')}")
-                print(f"   ✓ Role: {user.get('role', {}).get('name', 'Unknown')}")
+                echo(f"   ✓ Connected as: {user.get('full_name', 'Unknown')}")
+                echo(f"   ✓ Email: {user.get('email', 'Unknown')}")
+                echo(f"   ✓ Role: {user.get('role', {}).get('name', 'Unknown')}")
             else:
-                print("   ⚠ Unexpected user data format")
+                echo("   ⚠ Unexpected user data format")
         else:
-            print(f"   ❌ User info failed: {response.status_code} - {response.text}")
+            echo(f"   ❌ User info failed: {response.status_code} - {response.text}")
+            flush_output()
             return False
-        
-        print()
-        
+
+        echo()
+
         # Test 2: Get modules
-        print("   Testing modules endpoint...")
-        modules_url = f"{api_domain}/crm/v2/settings/modules"
-        
-        response = requests.get(modules_url, headers=headers, timeout=30)
-        
+        echo("   Testing modules endpoint...")
+
+        response = responses['modules']
+
         if response.status_code == 200:
             modules_data = response.json()
             if 'modules' in modules_data:
                 modules = modules_data['modules']
-                print(f"   ✓ Found {len(modules)} CRM modules")
-                
+                echo(f"   ✓ Found {len(modules)} CRM modules")
+
                 # Show first few modules
                 for i, module in enumerate(modules[:5]):
-                    print(f"     - {module.get('module_name', 'Unknown')}")
-                
+                    echo(f"     - {module.get('module_name', 'Unknown')}")
+
                 if len(modules) > 5:
-                    print(f"     ... and {len(modules) - 5} more")
+                    echo(f"     ... and {len(modules) - 5} more")
             else:
-                print("   ⚠ Unexpected modules data format")
+                echo("   ⚠ Unexpected modules data format")
         else:
-            print(f"   ❌ Modules test failed: {response.status_code} - {response.text}")
+            echo(f"   ❌ Modules test failed: {response.status_code} - {response.text}")
+            flush_output()
             return False
-        
-        print()
-        
+
+        echo()
+
         # Test 3: Get organization info
-        print("   Testing organization endpoint...")
-        org_url = f"{api_domain}/crm/v2/org"
-        
-        response = requests.get(org_url, headers=headers, timeout=30)
-        
+        echo("   Testing organization endpoint...")
+
+        response = responses['org']
+
         if response.status_code == 200:
             org_data = response.json()
             if 'org' in org_data and org_data['org']:
                 org = org_data['org'][0]
-                print(f"   ✓ Organization: {org.get('company_name', 'Unknown')}")
-                print(f"   ✓ Country: {org.get('country', 'Unknown')}")
-                print(f"   ✓ Time Zone: {org.get('time_zone', 'Unknown')}")
+                echo(f"   ✓ Organization: {org.get('company_name', 'Unknown')}")
+                echo(f"   ✓ Country: {org.get('country', 'Unknown')}")
+                echo(f"   ✓ Time Zone: {org.get('time_zone', 'Unknown')}")
             else:
-                print("   ⚠ Unexpected organization data format")
+                echo("   ⚠ Unexpected organization data format")
         else:
-            print(f"   ❌ Organization test failed: {response.status_code} - {response.text}")
+            echo(f"   ❌ Organization test failed: {response.status_code} - {response.text}")
+            flush_output()
             return False
-        
-        print()
-        print("="*60)
-        print("🎉 SUCCESS! Zoho CRM connection is working perfectly!")
-        print("✓ Authentication: Working")
-        print("✓ Token management: Working") 
-        print("✓ API connectivity: Working")
-        print("✓ User access: Confirmed")
-        print("✓ Module access: Confirmed")
-        print("✓ Organization access: Confirmed")
-        print()
-        print("Your MCP server is ready to use with AI assistants!")
-        print("="*60)
-        
+
+        echo()
+        echo("="*60)
+        echo("🎉 SUCCESS! Zoho CRM connection is working perfectly!")
+        echo("✓ Authentication: Working")
+        echo("✓ Token management: Working")
+        echo("✓ API connectivity: Working")
+        echo("✓ User access: Confirmed")
+        echo("✓ Module access: Confirmed")
+        echo("✓ Organization access: Confirmed")
+        echo()
+        echo("Your MCP server is ready to use with AI assistants!")
+        echo("="*60)
+        flush_output()
+
         return True
-        
+
     except Exception as e:
-        print(f"❌ Connection test failed: {str(e)}")
+        echo(f"❌ Connection test failed: {str(e)}")
+        flush_output()
         import traceback
         print("\nDetailed error:")
         traceback.print_exc()
@@ -167,4 +206,4 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Unexpected error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)